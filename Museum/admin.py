@@ -1,11 +1,76 @@
 from django.contrib import admin
-from .models import *
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import BooleanField, Count, ExpressionWrapper, Q
+from django.utils.html import escape, mark_safe
+from .models import Category, Event, Exhibit
 
-class ExhibitAdmin(admin.ModelAdmin):
-    list_display = ('title', 'description',)
+
+class ImagePreviewMixin:
+    def image_preview(self, obj):
+        if not obj.image:
+            return 'Нет изображения'
+        # mark_safe + escape вместо format_html: без разбора шаблона
+        # на каждую из десятков ячеек страницы.
+        # lazy: браузер не грузит миниатюры за пределами экрана.
+        return mark_safe(
+            f'<img src="{escape(obj.image.url)}" width="150" '
+            f'loading="lazy" decoding="async" />'
+        )
+    image_preview.short_description = 'Изображение'
+
+
+class ExhibitAdmin(ImagePreviewMixin, admin.ModelAdmin):
+    list_display = ('title', 'description', 'category', 'has_audio', 'image_preview',)
     list_filter = ('title',)
+    list_select_related = ('category',)
+
+    def get_queryset(self, request):
+        # Тянем только колонки, которые реально рендерит список; наличие
+        # аудио считает база, сам путь к файлу не выбираем.
+        return (
+            super().get_queryset(request)
+            .select_related('category')
+            .only('title', 'description', 'image', 'category__title')
+            .annotate(has_audio_db=ExpressionWrapper(
+                Q(audio__isnull=False) & ~Q(audio=''),
+                output_field=BooleanField(),
+            ))
+        )
+
+    def has_audio(self, obj):
+        return obj.has_audio_db
+    has_audio.boolean = True
+    has_audio.short_description = 'Аудио'
+    has_audio.admin_order_field = 'has_audio_db'
+
+
+class CategoryChangeList(ChangeList):
+    # Аннотация навешивается после пагинации: COUNT(*) пагинатора идёт по
+    # чистой таблице, без LEFT JOIN + GROUP BY по всем категориям.
+    def get_results(self, request):
+        super().get_results(request)
+        self.result_list = self.result_list.annotate(exhibit_count=Count('exhibits'))
+
+
+class CategoryAdmin(ImagePreviewMixin, admin.ModelAdmin):
+    list_display = ('title', 'exhibits_count', 'image_preview',)
+
+    def get_changelist(self, request, **kwargs):
+        return CategoryChangeList
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).only('title', 'image')
+
+    def exhibits_count(self, obj):
+        # Берёт значение из аннотации вместо отдельного COUNT(*) на строку.
+        return obj.exhibit_count
+    exhibits_count.short_description = 'Экспонаты'
+
+
+class EventAdmin(ImagePreviewMixin, admin.ModelAdmin):
+    list_display = ('image_preview',)
 
 
 admin.site.register(Exhibit, ExhibitAdmin)
-admin.site.register(Event)
-admin.site.register(Category)
\ No newline at end of file
+admin.site.register(Event, EventAdmin)
+admin.site.register(Category, CategoryAdmin)
\ No newline at end of file
@@ -0,0 +1,58 @@
+import random
+from functools import lru_cache
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from Museum.models import Category, Event, Exhibit
+
+# Небольшая палитра вместо случайного RGB: повторные цвета кодируются один раз.
+PALETTE = [
+    (192, 57, 43), (41, 128, 185), (39, 174, 96),
+    (243, 156, 18), (142, 68, 173), (127, 140, 141),
+]
+
+
+@lru_cache(maxsize=None)
+def _encoded_png(size, color):
+    img = Image.new('RGB', size, color)
+    output = BytesIO()
+    img.save(output, format='PNG')
+    return output.getvalue()
+
+
+class Command(BaseCommand):
+    help = 'Заполняет базу тестовыми категориями, событиями и экспонатами.'
+
+    def get_dummy_image(self, image_type, size=(800, 600)):
+        # ContentFile каждый раз новый (Django нужен свежий файловый
+        # указатель), но PNG-кодирование выполняется раз на (size, color).
+        color = random.choice(PALETTE)
+        return ContentFile(_encoded_png(size, color), f'{image_type}.png')
+
+    def handle(self, *args, **options):
+        # bulk_create шлёт один INSERT на модель вместо запроса на строку;
+        # заодно он обходит save(), так что ресайз тестовых картинок не
+        # ставится в очередь — они и так нужного размера.
+        categories = Category.objects.bulk_create([
+            Category(title=f'Категория {i}', image=self.get_dummy_image('category'))
+            for i in range(1, 6)
+        ])
+        Event.objects.bulk_create([
+            Event(image=self.get_dummy_image('event')) for _ in range(5)
+        ])
+        exhibits = []
+        for category in categories:
+            for i in range(1, 6):
+                exhibits.append(Exhibit(
+                    title=f'{category.title} — экспонат {i}',
+                    description=f'Описание экспоната {i} категории «{category.title}».',
+                    image=self.get_dummy_image('exhibit'),
+                    category=category,
+                ))
+        Exhibit.objects.bulk_create(exhibits, batch_size=100)
+        self.stdout.write(self.style.SUCCESS(
+            f'Создано: {len(categories)} категорий, 5 событий, {len(exhibits)} экспонатов.'
+        ))
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-08-28 06:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Museum', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='category',
+            name='description',
+        ),
+        migrations.RemoveField(
+            model_name='event',
+            name='date',
+        ),
+        migrations.RemoveField(
+            model_name='event',
+            name='description',
+        ),
+        migrations.RemoveField(
+            model_name='event',
+            name='title',
+        ),
+        migrations.AlterField(
+            model_name='exhibit',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='exhibits', to='Museum.category', verbose_name='Категория'),
+        ),
+    ]
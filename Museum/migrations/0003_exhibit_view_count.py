@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-08-28 06:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Museum', '0002_remove_category_description_remove_event_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exhibit',
+            name='view_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='Просмотры'),
+        ),
+    ]
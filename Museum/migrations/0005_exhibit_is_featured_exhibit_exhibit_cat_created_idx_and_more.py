@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-08-28 06:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Museum', '0004_category_created_at_category_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exhibit',
+            name='is_featured',
+            field=models.BooleanField(default=False, verbose_name='Избранный'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibit',
+            index=models.Index(fields=['category', '-created_at'], name='exhibit_cat_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='exhibit',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-created_at'], name='exhibit_featured_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-08-28 06:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Museum', '0005_exhibit_is_featured_exhibit_exhibit_cat_created_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Создано'),
+        ),
+        migrations.AlterField(
+            model_name='event',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Создано'),
+        ),
+        migrations.AlterField(
+            model_name='exhibit',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, verbose_name='Создано'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-08-28 06:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('Museum', '0006_alter_category_created_at_alter_event_created_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='is_active',
+            field=models.BooleanField(default=True, verbose_name='Активно'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-created_at'], name='event_active_created_idx'),
+        ),
+    ]
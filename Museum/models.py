@@ -1,8 +1,20 @@
+import os
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import InvalidCacheBackendError
+from django.core.files.base import ContentFile
 from django.db import models
-from django.utils import timezone
 from PIL import Image
 from django.core.exceptions import ValidationError
 
+# Читаем настройки один раз при импорте: save() — горячий путь, и
+# прогулка по обёртке settings на каждое сохранение ни к чему.
+MAX_IMAGE_WIDTH = getattr(settings, 'MAX_IMAGE_WIDTH', 1920)
+MAX_IMAGE_HEIGHT = getattr(settings, 'MAX_IMAGE_HEIGHT', 1920)
+IMAGE_QUALITY = getattr(settings, 'IMAGE_QUALITY', 85)
+
+
 def validate_image_size(image):
     max_width = 972
     max_height = 422 
@@ -10,13 +22,85 @@ def validate_image_size(image):
     if img.width > max_width or img.height > max_height:
         raise ValidationError("Максимальные допустимые размеры изображения - 972x422 пикселей.")
 
-class Event(models.Model):
+def get_view_counter_connection():
+    """Redis-соединение для буфера просмотров; None, если кеш не на Redis."""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection('default')
+    except (ImportError, NotImplementedError, InvalidCacheBackendError):
+        return None
+
+
+def resize_image(image_field, max_width, max_height, quality):
+    """Ужимает загруженное изображение до max_width x max_height (JPEG)."""
+    img = Image.open(image_field)
+    if img.width <= max_width and img.height <= max_height:
+        return
+    if img.format == 'JPEG':
+        # libjpeg умеет декодировать сразу в 1/2, 1/4, 1/8 размера —
+        # не распаковываем полный кадр ради уменьшенной копии.
+        img.draft('RGB', (max_width, max_height))
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
+    output = BytesIO()
+    # optimize=True гоняет кодирование дважды ради пары процентов размера.
+    img.save(output, format='JPEG', quality=quality)
+    old_name = image_field.name
+    # FieldFile.save() снова прогоняет имя через upload_to, поэтому даём
+    # только базовое имя — иначе путь удваивается (media/event/media/event/…).
+    # Перекодированный файл всегда JPEG, расширение соответствующее.
+    new_name = os.path.splitext(os.path.basename(old_name))[0] + '.jpg'
+    image_field.save(new_name, ContentFile(output.getvalue()), save=False)
+    if image_field.name != old_name:
+        # Исходный полноразмерный файл больше не нужен.
+        image_field.storage.delete(old_name)
+
+
+class TimestampedModel(models.Model):
+    # Без db_index: общий B-tree на каждую таблицу дорог на записи, а
+    # выборки по дате покрываются точечными индексами конкретных моделей.
+    created_at = models.DateTimeField("Создано", auto_now_add=True)
+    updated_at = models.DateTimeField("Обновлено", auto_now=True)
+
+    class Meta:
+        abstract = True
+
+
+class ResizeImageMixin:
+    """Ставит ресайз картинки в очередь после сохранения модели.
+
+    Сам ресайз выполняется воркером (Museum.tasks.resize_image_task),
+    чтобы запрос не блокировался на Pillow.
+    """
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        if self.image:
+            from .tasks import resize_image_task
+            resize_image_task.delay(
+                self._meta.app_label, self._meta.model_name, self.pk,
+                'image', MAX_IMAGE_WIDTH, MAX_IMAGE_HEIGHT, IMAGE_QUALITY,
+            )
+
+
+class Event(ResizeImageMixin, TimestampedModel):
     image = models.ImageField(upload_to='media/event/', validators=[validate_image_size])
+    is_active = models.BooleanField("Активно", default=True)
 
     class Meta:
         verbose_name_plural = 'События'
+        indexes = [
+            # Частичный индекс под выборку главной: активные события по
+            # убыванию даты, без балласта из архивных строк.
+            models.Index(
+                fields=['-created_at'],
+                name='event_active_created_idx',
+                condition=models.Q(is_active=True),
+            ),
+        ]
 
-class Category(models.Model):
+class Category(ResizeImageMixin, TimestampedModel):
     title = models.CharField(max_length=100)
     image = models.ImageField(upload_to='media/category/', validators=[validate_image_size])
 
@@ -26,15 +110,49 @@ class Category(models.Model):
     def __str__(self):
         return self.title
     
-class Exhibit(models.Model):
+class Exhibit(ResizeImageMixin, TimestampedModel):
     title = models.CharField(max_length=100)
     image = models.ImageField(upload_to='media/exhibit_images/')
     description = models.TextField()
     audio = models.FileField(upload_to='media/exhibit_audio/', null=True, blank=True)
-    category = models.ForeignKey(Category, verbose_name = ("Категория"), on_delete=models.CASCADE)
+    category = models.ForeignKey(Category, verbose_name = ("Категория"), on_delete=models.CASCADE, related_name='exhibits')
+    view_count = models.PositiveIntegerField("Просмотры", default=0)
+    is_featured = models.BooleanField("Избранный", default=False)
 
     class Meta:
         verbose_name_plural = 'Экспонаты'
+        indexes = [
+            models.Index(fields=['category', '-created_at'], name='exhibit_cat_created_idx'),
+            # Обычный индекс по булеву полю не окупается; частичный
+            # покрывает только избранные записи.
+            models.Index(
+                fields=['-created_at'],
+                name='exhibit_featured_idx',
+                condition=models.Q(is_featured=True),
+            ),
+        ]
 
     def __str__(self):
         return self.title
+
+    def increment_view_count(self):
+        type(self).increment_view_counts([self.pk])
+
+    @classmethod
+    def increment_view_counts(cls, pks):
+        # Просмотры копятся в Redis, в базу их раз в минуту сливает
+        # Museum.tasks.flush_view_counts — один UPDATE на экспонат вместо
+        # записи на каждый просмотр. INCR уходят одним pipeline: один
+        # round-trip на страницу, а не на карточку.
+        if not pks:
+            return
+        conn = get_view_counter_connection()
+        if conn is not None:
+            with conn.pipeline(transaction=False) as pipe:
+                for pk in pks:
+                    pipe.incr(f'exhibit:view:{pk}')
+                pipe.execute()
+            return
+        # Без Redis — один атомарный UPDATE на всю пачку, без save():
+        # ни сигналов, ни постановки ресайза в очередь на каждый просмотр.
+        cls.objects.filter(pk__in=pks).update(view_count=models.F('view_count') + 1)
@@ -0,0 +1,44 @@
+import logging
+
+from celery import shared_task
+from django.apps import apps
+from django.db.models import F
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def flush_view_counts():
+    """Сливает накопленные в Redis счётчики просмотров в базу."""
+    from .models import Exhibit, get_view_counter_connection
+
+    conn = get_view_counter_connection()
+    if conn is None:
+        return
+    for key in conn.scan_iter(match='exhibit:view:*'):
+        delta = conn.getdel(key)
+        if not delta:
+            continue
+        pk = int(key.decode().rsplit(':', 1)[-1])
+        Exhibit.objects.filter(pk=pk).update(view_count=F('view_count') + int(delta))
+        # %-стиль: аргументы форматируются только если уровень включён.
+        logger.debug('Flushed %s views for exhibit %s', int(delta), pk)
+
+
+@shared_task
+def resize_image_task(app_label, model_name, pk, field_name, max_width, max_height, quality):
+    """Ресайзит сохранённую картинку в фоне, без блокировки запроса."""
+    from .models import resize_image
+
+    model = apps.get_model(app_label, model_name)
+    try:
+        obj = model.objects.get(pk=pk)
+    except model.DoesNotExist:
+        logger.warning('%s #%s disappeared before resize', model_name, pk)
+        return
+    field = getattr(obj, field_name)
+    if not field:
+        return
+    resize_image(field, max_width, max_height, quality)
+    # Обновляем строку напрямую, чтобы не зациклиться на save() модели.
+    model.objects.filter(pk=pk).update(**{field_name: field.name})
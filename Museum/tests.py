@@ -1,2 +1,26 @@
+from functools import lru_cache
+from io import BytesIO
+
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from PIL import Image
+
+
+@lru_cache(maxsize=None)
+def _test_image_bytes(width, height):
+    img = Image.new('RGB', (width, height), (128, 128, 128))
+    output = BytesIO()
+    img.save(output, format='JPEG')
+    return output.getvalue()
+
+
+def create_test_image(width=100, height=100):
+    """Свежий SimpleUploadedFile поверх единожды закодированного JPEG.
 
+    Django нужен новый файловый указатель на каждую загрузку, но сам
+    PIL-энкодинг выполняется один раз на (width, height), а не в каждом
+    setUp.
+    """
+    return SimpleUploadedFile(
+        'test.jpg', _test_image_bytes(width, height), content_type='image/jpeg',
+    )
@@ -1,9 +1,17 @@
 from django.urls import path
-from Museum.views import *
+from Museum.views import about, contact, exhibits, home_json, main
 from django.conf import settings
 from django.conf.urls.static import static
 
 urlpatterns = [
     path('', main, name='main'),
     path('exhibits/<int:pk>', exhibits, name='exhibits'),
-] + static(settings.STATIC_URL, document_root=settings.STATIC_ROOT) + static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
\ No newline at end of file
+    path('about/', about, name='about'),
+    path('contact/', contact, name='contact'),
+    path('api/home/', home_json, name='home_json'),
+]
+
+# Только для разработки: в проде статику отдаёт WhiteNoise, медиа — nginx.
+if settings.DEBUG:
+    urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
+    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
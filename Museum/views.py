@@ -1,12 +1,139 @@
+import logging
+import os
+from datetime import datetime, timezone
+from functools import lru_cache
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.http import JsonResponse
+from django.core.paginator import Paginator
+from django.db.models import OuterRef, Prefetch, Subquery
 from django.shortcuts import render
-from .forms import ExhibitForm
-from .models import *
+from django.template import loader
+from django.views.decorators.cache import cache_control, cache_page
+from django.views.decorators.http import last_modified
+from .models import Category, Event, Exhibit
+
+# Сколько свежих экспонатов показываем в карточке категории на главной.
+RECENT_EXHIBITS_PER_CATEGORY = 4
+
+logger = logging.getLogger(__name__)
+
+# Карточек на страницу списка экспонатов.
+EXHIBITS_PER_PAGE = 48
 
 def exhibits(request, pk):
-    exhibits = Exhibit.objects.filter(category=pk)
-    return render(request, 'exhibitions.html', {'exhibits': exhibits})
+    # JOIN категории сразу: обращение к exhibit.category в шаблоне не
+    # будет стоить по SELECT на карточку.
+    # Порядок стабильный для пагинации и ложится на составной индекс
+    # (category, -created_at).
+    exhibits_qs = (
+        Exhibit.objects.filter(category=pk)
+        .select_related('category')
+        .order_by('-created_at')
+    )
+    # Пагинация: в памяти материализуется одна страница, а не вся
+    # категория целиком.
+    paginator = Paginator(exhibits_qs, EXHIBITS_PER_PAGE)
+    page = paginator.get_page(request.GET.get('page'))
+    exhibits_list = list(page.object_list)
+    # Показ страницы — это показ каждого экспоната на ней; инкременты
+    # уходят одной пачкой (pipeline в Redis либо один UPDATE в базу).
+    Exhibit.increment_view_counts([e.pk for e in exhibits_list])
+    # Страница уже материализована — количество озвученных экспонатов
+    # считается по ней же, без второго SELECT COUNT(*).
+    exhibits_with_audio = sum(1 for e in exhibits_list if e.audio)
+    if logger.isEnabledFor(logging.DEBUG):
+        # Список уже материализован: len() вместо лишнего SELECT COUNT(*).
+        logger.debug('Exhibits page %s loaded with %d exhibits (%d with audio)',
+                     pk, len(exhibits_list), exhibits_with_audio)
+    return render(request, 'exhibitions.html', {
+        'exhibits': exhibits_list,
+        'page_obj': page,
+        'exhibits_with_audio': exhibits_with_audio,
+    })
 
+# Главная меняется редко: отдаём готовый ответ из кеша 15 минут.
+@cache_page(60 * 15)
 def main(request):
-    category = Category.objects.all()
-    events = Event.objects.all()
-    return render(request, 'main.html', {'events': events, 'categories': category})
\ No newline at end of file
+    # Топ-N свежих экспонатов на категорию: коррелированный подзапрос
+    # ограничивает выборку прямо в базе, а to_attr кладёт результат в
+    # отдельный список, не трогая кеш менеджера exhibits.
+    recent_pks = (
+        Exhibit.objects.filter(category=OuterRef('category'))
+        .order_by('-created_at')
+        .values_list('pk', flat=True)[:RECENT_EXHIBITS_PER_CATEGORY]
+    )
+    # Шаблону нужны только заголовки/картинки: не тащим description,
+    # audio и прочие тяжёлые колонки на главную.
+    recent_exhibits = (
+        Exhibit.objects.filter(pk__in=Subquery(recent_pks))
+        .only('title', 'created_at', 'category_id')
+        .order_by('-created_at')
+    )
+    categories = list(
+        Category.objects.only('title', 'image').prefetch_related(
+            Prefetch('exhibits', queryset=recent_exhibits, to_attr='recent_exhibits')
+        )
+    )
+    events = list(Event.objects.filter(is_active=True).only('image').order_by('-created_at'))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Main page loaded with %d categories and %d events',
+                     len(categories), len(events))
+    return render(request, 'main.html', {'events': events, 'categories': categories})
+
+def build_home_payload():
+    """Содержимое главной в виде словарей — для JSON-варианта страницы.
+
+    values() отдаёт готовые словари без инстанцирования моделей (и без
+    десериализации лишних полей), а группировка по категориям делается
+    одним проходом в Python поверх единственного запроса к экспонатам.
+    """
+    categories = {}
+    for row in Category.objects.values('id', 'title', 'image'):
+        row['image'] = default_storage.url(row['image']) if row['image'] else None
+        row['exhibits'] = []
+        categories[row['id']] = row
+    exhibit_rows = (
+        Exhibit.objects.values('id', 'title', 'image', 'category_id')
+        .order_by('-created_at')
+    )
+    for row in exhibit_rows:
+        bucket = categories.get(row.pop('category_id'))
+        if bucket is None or len(bucket['exhibits']) >= RECENT_EXHIBITS_PER_CATEGORY:
+            continue
+        row['image'] = default_storage.url(row['image']) if row['image'] else None
+        bucket['exhibits'].append(row)
+    events = [
+        {'id': row['id'],
+         'image': default_storage.url(row['image']) if row['image'] else None}
+        for row in Event.objects.filter(is_active=True)
+                                .values('id', 'image').order_by('-created_at')
+    ]
+    return {'categories': list(categories.values()), 'events': events}
+
+
+def home_json(request):
+    # Повторные заходы (HTMX/клиентская навигация) обходят и ORM, и
+    # шаблонизатор: готовый словарь лежит в кеше и сериализуется сразу.
+    payload = cache.get_or_set('museum:home:json', build_home_payload, 60 * 15)
+    return JsonResponse(payload)
+
+
+@lru_cache(maxsize=None)
+def _template_mtime(template_name):
+    """Дата правки файла шаблона — для Last-Modified статичных страниц."""
+    origin = loader.get_template(template_name).origin
+    return datetime.fromtimestamp(os.path.getmtime(origin.name), tz=timezone.utc)
+
+# Статичные страницы: браузер/CDN держат копию сутки, повторные заходы
+# закрываются ответом 304 без рендера.
+@cache_control(public=True, max_age=86400)
+@last_modified(lambda request: _template_mtime('about.html'))
+def about(request):
+    return render(request, 'about.html')
+
+@cache_control(public=True, max_age=86400)
+@last_modified(lambda request: _template_mtime('contact.html'))
+def contact(request):
+    return render(request, 'contact.html')
@@ -3,6 +3,11 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Боевой запуск — через uvicorn: один воркер обслуживает много
+одновременных запросов, пока другие ждут базу:
+
+    uvicorn config.asgi:application --workers 4 --loop uvloop --http httptools
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.2/howto/deployment/asgi/
 """
@@ -43,8 +43,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # GZip выше всех, кто трогает тело ответа; ConditionalGet — сразу
+    # после него, чтобы 304 считался по уже сжатому ответу.
+    'django.middleware.gzip.GZipMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'debug_toolbar.middleware.DebugToolbarMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -71,6 +76,17 @@ TEMPLATES = [
     },
 ]
 
+# В проде шаблоны компилируются один раз и живут в памяти процесса:
+# cached.Loader убирает чтение с диска и разбор .html на каждый render().
+if not DEBUG:
+    TEMPLATES[0]['APP_DIRS'] = False
+    TEMPLATES[0]['OPTIONS']['loaders'] = [
+        ('django.template.loaders.cached.Loader', [
+            'django.template.loaders.filesystem.Loader',
+            'django.template.loaders.app_directories.Loader',
+        ]),
+    ]
+
 WSGI_APPLICATION = 'config.wsgi.application'
 
 
@@ -81,6 +97,10 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Держим соединение между запросами: для SQLite это бесплатно, а
+        # на клиент-серверных базах экономит TCP/TLS-рукопожатие на запрос.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -130,9 +150,107 @@ STATIC_URL = '/static/'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]
-# STATIC_ROOT = os.path.join(BASE_DIR, 'static/')
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+
+# WhiteNoise: раздача статики из процесса приложения.
+# Хешированные имена + предварительно сжатые .br/.gz копии позволяют
+# ставить годовой immutable max-age.
+if not DEBUG:
+    STORAGES = {
+        'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+        'staticfiles': {'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage'},
+    }
+WHITENOISE_MAX_AGE = 31536000
+WHITENOISE_USE_FINDERS = DEBUG
+WHITENOISE_AUTOREFRESH = DEBUG
+WHITENOISE_MANIFEST_STRICT = False
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+
+# LocMemCache живёт в рамках одного процесса: при нескольких воркерах
+# gunicorn кеш у каждого свой и инвалидация невозможна. С REDIS_URL кеш
+# общий для всех воркеров (django-redis — его же клиент использует буфер
+# счётчика просмотров), и сессии уезжают из базы в кеш.
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': REDIS_URL,
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            },
+        }
+    }
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cache'
+    SESSION_CACHE_ALIAS = 'default'
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Logging
+# https://docs.djangoproject.com/en/4.2/topics/logging/
+# Пишем в stdout: поток не блокируется на fsync/ротации файла, как
+# RotatingFileHandler, а ротацию логов делает супервизор процесса.
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'verbose': {
+            'format': '{asctime} {levelname} {name} {message}',
+            'style': '{',
+        },
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'verbose',
+        },
+    },
+    'loggers': {
+        'django': {
+            'handlers': ['console'],
+            'level': 'INFO',
+        },
+        # Необработанные исключения вьюх логируются здесь самим Django —
+        # оборачивать каждую вьюху в try/except не нужно.
+        'django.request': {
+            'handlers': ['console'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+        'Museum': {
+            'handlers': ['console'],
+            'level': 'DEBUG' if DEBUG else 'INFO',
+        },
+    },
+}
+
+# Celery
+# https://docs.celeryq.dev/en/stable/django/first-steps-with-django.html
+
+CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL', 'redis://localhost:6379/0')
+# Без брокера (локальная разработка) задачи выполняются сразу, в процессе.
+CELERY_TASK_ALWAYS_EAGER = os.getenv('CELERY_TASK_ALWAYS_EAGER', str(DEBUG)) == 'True'
+CELERY_BEAT_SCHEDULE = {
+    'flush-view-counts': {
+        'task': 'Museum.tasks.flush_view_counts',
+        'schedule': 60.0,
+    },
+}
+
+# Ограничения на загружаемые изображения
+
+MAX_IMAGE_WIDTH = 1920
+MAX_IMAGE_HEIGHT = 1920
+IMAGE_QUALITY = 85
@@ -0,0 +1,33 @@
+"""Настройки для публичных воркеров.
+
+Публичные страницы музея не используют админку, сообщения и
+debug_toolbar — отдельный процесс gunicorn без этих приложений несёт
+меньше middleware и URL-паттернов на запрос:
+
+    DJANGO_SETTINGS_MODULE=config.settings_public gunicorn config.wsgi
+
+Админка живёт во втором пуле воркеров на обычных настройках.
+"""
+from .settings import *  # noqa: F401,F403
+
+INSTALLED_APPS = [app for app in INSTALLED_APPS if app not in (
+    'django.contrib.admin',
+    'django.contrib.messages',
+    'debug_toolbar',
+)]
+
+MIDDLEWARE = [mw for mw in MIDDLEWARE if mw not in (
+    'debug_toolbar.middleware.DebugToolbarMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+)]
+
+TEMPLATES[0]['OPTIONS']['context_processors'] = [
+    cp for cp in TEMPLATES[0]['OPTIONS']['context_processors']
+    if cp not in (
+        'django.contrib.auth.context_processors.auth',
+        'django.contrib.messages.context_processors.messages',
+    )
+]
+
+ROOT_URLCONF = 'config.urls_public'
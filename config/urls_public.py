@@ -0,0 +1,6 @@
+"""URL-ы публичного пула воркеров: только страницы музея, без админки."""
+from django.urls import include, path
+
+urlpatterns = [
+    path("", include("Museum.urls")),
+]